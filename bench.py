@@ -0,0 +1,1538 @@
+#!/usr/bin/env python3
+"""Offline benchmarks for the Big Rock scrapers.
+
+    python bench.py record   [--tournament NAME] [--fixtures DIR]
+    python bench.py scrapers [--tournament NAME] [--fixtures DIR] [--runs N] [--latency-ms MS]
+    python bench.py parity   [--fixtures DIR] [--runs N]
+    python bench.py tokenizer [--fixtures DIR] [--runs N] [--scale N]
+    python bench.py leaderboard [--runs N] [--categories N] [--rows N ...]
+    python bench.py scoped   [--fixtures DIR] [--runs N] [--chrome-kib N]
+    python bench.py names    [--fixtures DIR] [--runs N] [--repeat N]
+    python bench.py timestamps [--fixtures DIR] [--runs N] [--events N]
+    python bench.py classify [--fixtures DIR] [--runs N] [--events N]
+    python bench.py eventstore [--fixtures DIR] [--runs N] [--events N ...]
+    python bench.py journal  [--fixtures DIR] [--events N] [--scrapes N] [--new N]
+    python bench.py jsoncache [--fixtures DIR] [--runs N] [--repeat N]
+    python bench.py contention [--fixtures DIR] [--threads N] [--ops N] [--rounds N]
+    python bench.py serialize [--fixtures DIR] [--runs N] [--events N]
+
+`record` runs one forced scrape against the live site with
+BIGROCK_HTTP_MODE=record, saving every page / API body to the fixture dir
+(plus the tournaments index and settings it used). `scrapers` replays those
+fixtures in a scratch directory — no network — and times scrape_participants,
+scrape_events and scrape_leaderboard end to end with cold caches each run.
+`parity` parses every recorded page with each available HTML backend, fails
+if their output differs, and reports parse time per page type; it also warns
+where a page's embedded data has under half the rows its HTML does. `tokenizer`
+times the feed parser against the pre-tokenizer scan on the largest feed page.
+`leaderboard` times the leaderboard parser on synthetic pages of growing size
+against the nested find_all version it replaced, and checks they agree.
+`scoped` wraps each recorded page in production-style chrome and compares
+whole-page parsing with the scoped (pre-sliced) parse: output, time, peak memory,
+then checks the scoped parse still finds rows moved outside <main>.
+`names` runs every text line of the recorded pages through the boat-name
+validator and normalizer, legacy vs memoized, cold and warm.
+`timestamps` compares dateutil-keyed sorting, dedup and day bucketing with the
+stored ts_epoch/date_et fields, then times /hooked and /release-summary-data.
+`classify` checks the event taxonomy against the old text scans and times the
+handlers' per-request species/resolution checks against the stored fields.
+`eventstore` times the event routes reading the whole events.json against the
+SQLite store's queries as the event count grows, and checks they agree.
+`journal` replays a run of small scrapes, rewriting events.json each time vs
+appending to the journal (with compaction), and compares time and bytes written.
+`jsoncache` times the emailer's settings checks and the hot routes with every
+JSON read re-parsed vs served from the stat-validated cache, then checks the
+cache sees writes and never shares mutable results.
+`contention` hammers cache.json freshness stamps from many threads, the old
+load/mutate/save way vs FreshnessStore, counting lost stamps, and races
+claim_refresh to check there is exactly one winner per stale key.
+`serialize` dumps and loads the largest cache files (events, demo_data,
+leaderboard) the old indent=2 way and with each available compact backend,
+comparing time and size and checking old files still read back the same.
+"""
+import argparse
+import json
+import os
+import re
+import pwd
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_FIXTURES = os.path.join(ROOT, "cache", "fixtures")
+# Relative feed times resolve against the clock, so these differ run to run
+_CLOCK_FIELDS = ("timestamp", "ts_epoch", "date_et")
+# Classified at ingest by the event taxonomy; the legacy reference parsers predate them
+_TAXONOMY_FIELDS = ("species", "weight_lbs", "resolution")
+
+
+def _import_app(mode: str, fixtures: str, latency_ms: float = 0):
+    """Import app.py with the record/replay switches set (they are read at import)."""
+    os.environ["BIGROCK_HTTP_MODE"] = mode
+    os.environ["BIGROCK_FIXTURE_DIR"] = os.path.abspath(fixtures)
+    os.environ["BIGROCK_REPLAY_LATENCY_MS"] = str(latency_ms)
+    if "AUDIO_USER" not in os.environ:
+        try:
+            pwd.getpwnam("pi")
+        except KeyError:
+            os.environ["AUDIO_USER"] = pwd.getpwuid(os.getuid()).pw_name
+    sys.path.insert(0, ROOT)
+    import app
+    return app
+
+
+def _summary(samples: list) -> str:
+    return (f"min {min(samples) * 1000:8.1f} ms   median {statistics.median(samples) * 1000:8.1f} ms"
+            f"   max {max(samples) * 1000:8.1f} ms")
+
+
+def cmd_record(args):
+    app = _import_app("record", args.fixtures)
+    os.makedirs(args.fixtures, exist_ok=True)
+    tournament = args.tournament or app.get_current_tournament()
+    print(f"⏺️  Recording {tournament} into {args.fixtures}")
+    app.scrape_reeltime_live_tournaments(force=True)
+    app.scrape_participants(force=True, tournament=tournament)
+    app.scrape_events(force=True, tournament=tournament)
+    app.scrape_leaderboard(tournament, force=True)
+    events_url = app._get_tournament_urls(tournament).get('events')
+    if events_url:
+        app.fetch_html(app._whos_fishing_url(events_url))
+    # Replay needs the same tournament → URL mapping the recording used.
+    shutil.copyfile(app.TOURNAMENTS_CACHE, os.path.join(args.fixtures, "_tournaments.json"))
+    settings = app.load_settings()
+    settings["tournament"] = tournament
+    app.safe_json_dump(os.path.join(args.fixtures, "_settings.json"), settings)
+    count = sum(1 for f in os.listdir(args.fixtures) if not f.startswith("_"))
+    print(f"✅ {count} responses recorded")
+
+
+def _replay_workdir(fixtures: str) -> str:
+    work = tempfile.mkdtemp(prefix="bigrock-bench-")
+    os.makedirs(os.path.join(work, "cache"), exist_ok=True)
+    for src, dst in (("_tournaments.json", os.path.join("cache", "tournaments.json")),
+                     ("_settings.json", "settings.json")):
+        path = os.path.join(fixtures, src)
+        if not os.path.exists(path):
+            sys.exit(f"❌ {path} missing — run `bench.py record` first")
+        shutil.copyfile(path, os.path.join(work, dst))
+    return work
+
+
+def _reset_caches(app, tournament: str):
+    """Cold start: drop freshness stamps and every per-tournament artifact."""
+    app.PAGE_FINGERPRINTS._prints = None
+    for path in (app.CACHE_FILE, app.FINGERPRINTS_FILE):
+        if os.path.exists(path):
+            os.remove(path)
+    for folder in (os.path.dirname(app.get_cache_path(tournament, "x")), app.HTTP_CACHE_DIR):
+        shutil.rmtree(folder, ignore_errors=True)
+    app.EVENT_STORE.clear(tournament)
+
+
+def cmd_scrapers(args):
+    fixtures = os.path.abspath(args.fixtures)
+    work = _replay_workdir(fixtures)
+    os.chdir(work)
+    app = _import_app("replay", fixtures, args.latency_ms)
+    tournament = args.tournament or app.get_current_tournament()
+    steps = {
+        "participants": lambda: app.scrape_participants(force=True, tournament=tournament),
+        "events": lambda: app.scrape_events(force=True, tournament=tournament),
+        "leaderboard": lambda: app.scrape_leaderboard(tournament, force=True),
+    }
+    timings = {name: [] for name in steps}
+    timings["total"] = []
+    sizes = {}
+    for _ in range(args.runs):
+        _reset_caches(app, tournament)
+        total = 0.0
+        for name, fn in steps.items():
+            t0 = time.perf_counter()
+            result = fn()
+            elapsed = time.perf_counter() - t0
+            timings[name].append(elapsed)
+            total += elapsed
+            sizes[name] = len(result or [])
+        timings["total"].append(total)
+
+    print(f"\n📊 {tournament} — {args.runs} replay run(s), latency {args.latency_ms:g} ms/request")
+    for name, samples in timings.items():
+        rows = f"{sizes[name]:5d} rows" if name in sizes else " " * 10
+        print(f"  {name:13s} {rows}   {_summary(samples)}")
+    shutil.rmtree(work, ignore_errors=True)
+
+
+def _load_pages(fixtures: str) -> list:
+    pages = []
+    for name in sorted(os.listdir(fixtures)):
+        if name.startswith("_") or not name.endswith(".json"):
+            continue
+        with open(os.path.join(fixtures, name), encoding="utf-8") as f:
+            entry = json.load(f)
+        if entry.get("kind") == "html" and entry.get("body"):
+            pages.append(entry)
+    return pages
+
+
+def _page_parsers(app, pages: list) -> dict:
+    """page type -> fn(html, url, parser) returning comparable parse output."""
+    participants = {}
+    for entry in pages:
+        if app.render_profile_for(entry["url"])[0] == "participants":
+            rows, _ = app._parse_participants_html(entry["body"], entry["url"], "html.parser")
+            participants.update(rows)
+    known = {uid: row["boat"] for uid, row in participants.items()}
+
+    def events(html, url, parser):
+        # timestamps are "now minus 5h" — compare everything but the clock
+        return [(key, {k: v for k, v in ev.items() if k not in _CLOCK_FIELDS})
+                for key, ev in app._parse_events_page(html, participants, parser=parser)]
+
+    return {
+        "participants": lambda html, url, parser: app._parse_participants_html(html, url, parser),
+        "feed": events,
+        "leaderboard": lambda html, url, parser: app._parse_leaderboard_html(html, url, parser),
+        "whos-fishing": lambda html, url, parser: app._parse_whos_fishing_html(html, known, parser),
+    }
+
+
+def cmd_parity(args):
+    fixtures = os.path.abspath(args.fixtures)
+    os.chdir(tempfile.mkdtemp(prefix="bigrock-parity-"))
+    app = _import_app("replay", fixtures)
+    backends = ["html.parser"]
+    try:
+        import lxml  # noqa: F401
+        backends.append("lxml")
+    except ImportError:
+        print("⚠️ lxml not installed — only html.parser can be timed")
+    pages = _load_pages(fixtures)
+    parsers = _page_parsers(app, pages)
+
+    timings = {}    # (page type, backend) -> [seconds per page]
+    mismatches = embedded_short = 0
+    for entry in pages:
+        kind = app.render_profile_for(entry["url"])[0]
+        parse = parsers.get(kind)
+        if not parse:
+            continue
+        outputs = {}
+        for backend in backends:
+            samples = []
+            for _ in range(args.runs):
+                t0 = time.perf_counter()
+                outputs[backend] = parse(entry["body"], entry["url"], backend)
+                samples.append(time.perf_counter() - t0)
+            timings.setdefault((kind, backend), []).append(statistics.median(samples))
+        reference = json.dumps(outputs[backends[0]], sort_keys=True, default=str)
+        for backend in backends[1:]:
+            if json.dumps(outputs[backend], sort_keys=True, default=str) != reference:
+                mismatches += 1
+                print(f"❌ {backend} output differs from {backends[0]} for {entry['url']}")
+        short = _embedded_shortfall(app, kind, entry)
+        if short:
+            embedded_short += 1
+            print(f"⚠️ embedded data has {short[0]} row(s), the HTML {short[1]}, for {entry['url']}")
+
+    print(f"\n📊 Parse time per page (median of {args.runs}), {len(pages)} recorded page(s)")
+    for kind in parsers:
+        row = {b: timings.get((kind, b)) for b in backends}
+        if not row[backends[0]]:
+            continue
+        cells = [f"{b} {statistics.mean(row[b]) * 1000:7.2f} ms" for b in backends]
+        if len(backends) > 1:
+            cells.append(f"speedup {statistics.mean(row[backends[0]]) / statistics.mean(row[backends[-1]]):.2f}x")
+        print(f"  {kind:13s} {len(row[backends[0]]):3d} page(s)   " + "   ".join(cells))
+    print("✅ All backends produced identical output" if not mismatches
+          else f"❌ {mismatches} page(s) differ between backends")
+    if embedded_short:
+        print(f"⚠️ {embedded_short} page(s) where embedded data found under half the HTML's rows")
+    sys.exit(1 if mismatches else 0)
+
+
+def _embedded_shortfall(app, kind: str, entry: dict) -> tuple | None:
+    """(embedded rows, HTML rows) when a page's embedded data has under half the rows its HTML does."""
+    if kind == "participants":
+        embedded = app.embedded_participants(entry["body"], entry["url"])
+        html_rows = len(app._parse_participants_soup(entry["body"], entry["url"])[0]) if embedded else 0
+    elif kind == "leaderboard":
+        embedded = app.embedded_leaderboard(entry["body"], entry["url"])
+        html_rows = len(app._parse_leaderboard_soup(entry["body"], entry["url"])) if embedded else 0
+    else:
+        return None
+    if embedded and len(embedded) * 2 < html_rows:
+        return len(embedded), html_rows
+    return None
+
+
+def _legacy_parse_events_soup(app, soup, participants: dict) -> list:
+    """The three-pass feed scan as it was before the tokenizer (reference for `bench.py tokenizer`)."""
+    # Labels/patterns to skip when extracting description lines
+    _SKIP_LABELS = {
+        'score alert', 'photo', 'video', 'message', 'stats', 'all',
+        'scores', 'photos', 'videos', 'messages', 'posts', 'feed',
+    }
+    _REACT_RE = re.compile(r'^[\U0001F44D\U00002764\U0001F3C6\U0001F41F'
+                           r'\U0001F4AA\U0001F389\U0001F4B0\U0001F600-\U0001F64F'
+                           r'\U0001F300-\U0001F5FF\U0001F680-\U0001F6FF\s]+$')
+    # Header pattern: "Boat · Xd" — the · may be on its own line due to HTML structure
+    _HEADER_RE = re.compile(r'^(.{2,60}?)\s*[·•]\s*(\d+\s*[smhdw])\s*$', re.UNICODE)
+    _DESC_RE   = re.compile(r'released|boated|weighed|hooked up|pulled hook|wrong species', re.I)
+
+    candidates = []
+
+    # Strategy 1: full-page text-line scan (structure-independent)
+    # Gets all rendered text, handles any HTML nesting
+    raw_lines = [l.strip() for l in soup.get_text('\n').splitlines() if l.strip()]
+
+    # Reassemble split headers: if line[i+1] == '·' and line[i+2] is a time, join them
+    lines = []
+    i = 0
+    while i < len(raw_lines):
+        rl = raw_lines[i]
+        if (i + 2 < len(raw_lines)
+                and raw_lines[i + 1].strip() in ('·', '•', '\u00b7')
+                and re.match(r'^\d+\s*[smhdw]$', raw_lines[i + 2])):
+            lines.append(f"{rl} · {raw_lines[i + 2]}")
+            i += 3
+        else:
+            lines.append(rl)
+            i += 1
+
+    i = 0
+    while i < len(lines):
+        m = _HEADER_RE.match(lines[i])
+        if m:
+            boat     = m.group(1).strip()
+            time_str = m.group(2).strip()
+            if app._is_valid_boat_name(boat):
+                ts_dt = app._parse_relative_time(time_str)
+                if ts_dt:
+                    desc = ''
+                    for j in range(i + 1, min(i + 10, len(lines))):
+                        jl = lines[j]
+                        if _HEADER_RE.match(jl):
+                            break
+                        if jl.lower() in _SKIP_LABELS or _REACT_RE.match(jl):
+                            continue
+                        # Strip leading "Score Alert" prefix and emojis injected by ReelTime
+                        jl = re.sub(r'^score\s+alert\s*', '', jl, flags=re.I).strip()
+                        jl = app._strip_emoji(jl)
+                        if not jl:
+                            continue
+                        if _DESC_RE.search(jl) and not app._JUNK_DESC_RE.search(jl):
+                            desc = jl
+                            break
+                    if desc:
+                        uid = app.normalize_boat_name(boat)
+                        if uid in participants:
+                            boat = participants[uid]['boat']
+                        event_type = app._classify_event(desc)
+                        dkey = f"{uid}_{event_type}_{desc.strip().lower()}_{ts_dt.strftime('%Y-%m-%d')}"
+                        candidates.append((dkey, {
+                            'timestamp': ts_dt.isoformat(),
+                            'event':     event_type,
+                            'boat':      boat,
+                            'uid':       uid,
+                            'details':   desc,
+                            'time_str':  time_str,
+                        }))
+        i += 1
+
+    # Strategy 2: regex search on space-joined page text
+    # Catches cases where · is not on its own line but adjacent to name/time
+    # (only when strategy 1 recognised no posts at all)
+    if not candidates:
+        flat = re.sub(r'\s+', ' ', soup.get_text(' '))
+        for m in re.finditer(
+            r'(\b\S[^·•\n]{1,59}?)\s*[·•]\s*(\d+\s*[smhdw])\b',
+            flat
+        ):
+            boat     = m.group(1).strip()
+            time_str = m.group(2).strip()
+            if not app._is_valid_boat_name(boat):
+                continue
+            ts_dt = app._parse_relative_time(time_str)
+            if not ts_dt:
+                continue
+            after = flat[m.end():m.end() + 600]
+            dm = re.search(
+                r'([A-Z][^.!?]{3,150}?(?:released|boated|weighed|hooked up|pulled hook|wrong species)[^.!?]{0,100}[.!?]?)',
+                after, re.I
+            )
+            if not dm:
+                continue
+            desc = re.sub(r'^score\s+alert\s*', '', dm.group(1).strip(), flags=re.I).strip()
+            desc = app._strip_emoji(desc)
+            if not desc:
+                continue
+            uid  = app.normalize_boat_name(boat)
+            if uid in participants:
+                boat = participants[uid]['boat']
+            event_type = app._classify_event(desc)
+            dkey = f"{uid}_{event_type}_{desc.strip().lower()}_{ts_dt.strftime('%Y-%m-%d')}"
+            candidates.append((dkey, {
+                'timestamp': ts_dt.isoformat(), 'event': event_type,
+                'boat': boat, 'uid': uid, 'details': desc,
+                'time_str': time_str,
+            }))
+
+    # Strategy 3: old element/attribute selectors (legacy sites)
+    if not candidates:
+        for article in soup.select(
+            'article.m-b-20, article.entry, div.activity, li.event, div.feed-item'
+        ):
+            time_tag = article.select_one('p.pull-right, time, .time')
+            name_tag = article.select_one('h4.montserrat, h4, h3')
+            desc_tag = article.select_one('p > strong, strong, .desc, .details')
+            if not time_tag or not name_tag or not desc_tag:
+                continue
+            raw = time_tag.get_text(strip=True).replace('@', '').strip()
+            ts_dt = app._parse_relative_time(raw)
+            if not ts_dt:
+                try:
+                    ts_dt = app.date_parser.parse(raw).replace(year=app.datetime.now(app.ZoneInfo('UTC')).year)
+                except Exception:
+                    continue
+            boat = name_tag.get_text(strip=True)
+            desc = app._strip_emoji(desc_tag.get_text(strip=True))
+            if not desc:
+                continue
+            uid  = app.normalize_boat_name(boat)
+            if uid in participants:
+                boat = participants[uid]['boat']
+            event_type = app._classify_event(desc)
+            dkey = f"{uid}_{event_type}_{desc.strip().lower()}_{ts_dt.strftime('%Y-%m-%d')}"
+            is_relative = bool(re.match(r'^\d+\s*[smhdw]\b', raw.lower()))
+            ev = {
+                'timestamp': ts_dt.isoformat(), 'event': event_type,
+                'boat': boat, 'uid': uid, 'details': desc,
+            }
+            if is_relative:
+                ev['time_str'] = raw
+            candidates.append((dkey, ev))
+
+    return candidates
+
+
+def _events_output(candidates: list) -> list:
+    # timestamps are "now minus 5h" — compare everything but the clock
+    return [(key, {k: v for k, v in ev.items() if k not in _CLOCK_FIELDS and k not in _TAXONOMY_FIELDS})
+            for key, ev in candidates]
+
+
+def cmd_tokenizer(args):
+    fixtures = os.path.abspath(args.fixtures)
+    os.chdir(tempfile.mkdtemp(prefix="bigrock-tokenizer-"))
+    app = _import_app("replay", fixtures)
+    feeds = [e for e in _load_pages(fixtures) if app.render_profile_for(e["url"])[0] == "feed"]
+    if not feeds:
+        sys.exit("❌ No recorded feed pages — run `bench.py record` first")
+    page = max(feeds, key=lambda e: len(e["body"]))
+    html = page["body"]
+    if args.scale > 1:
+        # Grow the page by repeating its body, as a feed looks late in a tournament
+        head, sep, rest = html.partition("<body")
+        body_start = rest.index(">") + 1
+        inner = rest[body_start:].rsplit("</body>", 1)[0]
+        html = head + sep + rest[:body_start] + inner * args.scale + "</body></html>"
+    print(f"📄 {page['url']} — {len(html) / 1024:.0f} KiB (x{args.scale}), backend {app.HTML_PARSER}")
+    # Second case: the same page with no recognisable post headers, like the
+    # empty probe pages past the end of pagination — every fallback gets tried.
+    cases = (("feed page", html), ("no posts", html.replace("·", "-").replace("•", "-")))
+    same = True
+    for label, case_html in cases:
+        soup = app.make_soup(case_html)
+        results = {}
+        for name, fn in (("legacy", lambda: _legacy_parse_events_soup(app, soup, {})),
+                         ("tokenizer", lambda: app._parse_events_soup(soup, {}, case_html))):
+            samples = []
+            for _ in range(args.runs):
+                t0 = time.perf_counter()
+                out = fn()
+                samples.append(time.perf_counter() - t0)
+            results[name] = (_events_output(out), samples)
+            print(f"  {label:10s} {name:10s} {len(out):5d} posts   {_summary(samples)}")
+        identical = results["legacy"][0] == results["tokenizer"][0]
+        same = same and identical
+        speedup = statistics.median(results["legacy"][1]) / statistics.median(results["tokenizer"][1])
+        print(f"  {label:10s} speedup {speedup:.2f}x — " + ("✅ identical output" if identical else "❌ output differs"))
+    sys.exit(0 if same else 1)
+
+
+def _legacy_parse_leaderboard_html(app, html: str, leaderboard_url: str) -> list:
+    """The leaderboard parser as it was before the linear engine (reference for `bench.py leaderboard`)."""
+    soup = app.make_soup(html)
+    leaderboard = []
+
+    img_map = app._build_img_map(soup, leaderboard_url)
+    _LB_SKIP = {
+        'no results', 'register now', 'login', 'disclaimer', 'additional links',
+        'reeltime apps', 'secure your spot', 'all results displayed',
+        'data may be delayed', 'prize pool', 'morehead city',
+    }
+    _PTS_RE   = re.compile(r'([\d,]+)\s*pts?', re.I)
+    _TIME_RE  = re.compile(r'(\d{1,2}:\d{2}\s*[AP]M)', re.I)
+    _WGHT_RE  = re.compile(r'([\d.]+)\s*lbs?', re.I)
+
+    # Strategy 1: h3 tags as category headers (new ReelTime structure)
+    h3_cats = []
+    for h3 in soup.find_all('h3'):
+        txt = h3.get_text(strip=True)
+        tl = txt.lower()
+        if not txt or any(tl.startswith(s) for s in _LB_SKIP) \
+                or any(w in tl for w in ('annual', 'tournament', 'register', 'login',
+                                         'secure your', 'morehead')):
+            continue
+        h3_cats.append((txt, h3))
+
+    def _add_lb_entry(cat_name, boat_name, score, sib_text, rank, angler=None):
+        """Append one leaderboard entry and return new rank."""
+        if not boat_name or not app._is_valid_boat_name(boat_name):
+            return rank
+        uid = app.normalize_boat_name(boat_name or angler or f'rank_{rank}')
+        img_src = img_map.get((boat_name or '').lower())
+        if img_src and boat_name:
+            app.IMAGE_SOURCES[uid] = (boat_name, img_src, leaderboard_url)
+        leaderboard.append({
+            'rank_raw': str(rank),
+            'category': cat_name,
+            'angler':   angler,
+            'boat':     boat_name,
+            'type':     None,
+            'points':   score,
+            'points_num': app.parse_points_number(score),
+            'uid':      uid,
+            'image_path': f'/boat-image/{uid}',
+        })
+        return rank + 1
+
+    def _extract_entry(el_text, el, cat_name):
+        """Return (boat_name, score, angler) from element text, or None."""
+        tl = el_text.lower()
+        if not el_text or any(tl.startswith(s) for s in _LB_SKIP):
+            return None
+        pm = _PTS_RE.search(el_text)
+        tm = _TIME_RE.search(el_text)
+        wm = _WGHT_RE.search(el_text)
+        score_m = pm or tm or wm
+        if not score_m:
+            return None
+        score = score_m.group(0)
+        img_tag = el.find('img') if hasattr(el, 'find') else None
+        boat_name = (img_tag.get('alt') or '').strip() if img_tag else ''
+        if not boat_name:
+            boat_name = re.sub(re.escape(score) + r'.*$', '', el_text).strip().split('\n')[0].strip()
+        angler = None
+        if wm and not pm and not any(b in el_text.lower() for b in app.KNOWN_BUILDERS):
+            angler, boat_name = boat_name, None
+        return boat_name, score, angler
+
+    if h3_cats:
+        for cat_name, h3_el in h3_cats:
+            rank = 1
+            seen_lb = set()
+            for sib in h3_el.next_siblings:
+                if getattr(sib, 'name', None) == 'h3':
+                    break
+                if not hasattr(sib, 'get_text'):
+                    continue
+                sib_text = sib.get_text(' ', strip=True)
+                if not sib_text:
+                    continue
+
+                # If this sibling has multiple score entries, recurse into children
+                all_scores = list(_PTS_RE.finditer(sib_text)) + \
+                             list(_TIME_RE.finditer(sib_text)) + \
+                             list(_WGHT_RE.finditer(sib_text))
+                if len(all_scores) > 1:
+                    for child in sib.find_all(True):
+                        ct = child.get_text(' ', strip=True)
+                        if not ct or len(ct) > 300:
+                            continue
+                        result = _extract_entry(ct, child, cat_name)
+                        if result:
+                            bname, score, angler = result
+                            key = (bname or angler or '').lower()
+                            if key and key not in seen_lb:
+                                seen_lb.add(key)
+                                rank = _add_lb_entry(cat_name, bname, score, ct, rank, angler)
+                else:
+                    result = _extract_entry(sib_text, sib, cat_name)
+                    if result:
+                        bname, score, angler = result
+                        key = (bname or angler or '').lower()
+                        if key and key not in seen_lb:
+                            seen_lb.add(key)
+                            rank = _add_lb_entry(cat_name, bname, score, sib_text, rank, angler)
+
+    # Strategy 2: text-line scan guided by known category names (handles any nesting)
+    if not leaderboard and h3_cats:
+        cat_names = [c for c, _ in h3_cats]
+        page_lines = [l.strip() for l in soup.get_text('\n').splitlines() if l.strip()]
+        current_cat = None
+        rank = 1
+        seen_lb2 = set()
+        i = 0
+        while i < len(page_lines):
+            line = page_lines[i]
+            if line in cat_names:
+                current_cat = line
+                rank = 1
+                i += 1
+                continue
+            if not current_cat or line.lower() == 'no results':
+                i += 1
+                continue
+            # Try combining 1-3 consecutive lines to find "Boat Score"
+            for width in range(1, 4):
+                if i + width > len(page_lines):
+                    break
+                candidate = ' '.join(page_lines[i:i + width])
+                pm2 = _PTS_RE.search(candidate)
+                tm2 = _TIME_RE.search(candidate)
+                wm2 = _WGHT_RE.search(candidate)
+                sm = pm2 or tm2 or wm2
+                if sm:
+                    score = sm.group(0)
+                    bname = re.sub(re.escape(score) + r'.*$', '', candidate).strip()
+                    # Deduplicate repeated words (img alt + span text both present)
+                    bname = ' '.join(dict.fromkeys(bname.split()))
+                    bname = bname.strip()
+                    if bname and app._is_valid_boat_name(bname):
+                        key = f"{bname.lower()}_{current_cat}"
+                        if key not in seen_lb2:
+                            seen_lb2.add(key)
+                            rank = _add_lb_entry(current_cat, bname, score, candidate, rank)
+                    break
+            i += 1
+
+    # Strategy 4: tab/table structure (old sites fallback)
+    if not leaderboard:
+        categories = [a.get_text(strip=True) for a in soup.select(
+            "ul.dropdown-menu li a.leaderboard-nav, a[data-toggle='tab']"
+        )]
+        categories = list(dict.fromkeys(c for c in categories if c))
+
+        def collect_rows_from_container(container, category_label):
+            for row in container.select('tr.montserrat, tr'):
+                cols = row.find_all('td')
+                if len(cols) < 2:
+                    continue
+                rank = cols[0].get_text(strip=True)
+                boat_block = cols[1]
+                points = cols[-1].get_text(strip=True)
+                h4 = boat_block.find('h4') or boat_block.find('strong') or boat_block.find('b')
+                name = h4.get_text(strip=True) if h4 else boat_block.get_text(' ', strip=True)
+                text_after = boat_block.get_text(' ', strip=True).replace(name, '').strip()
+                angler, boat, btype = None, name, None
+                if 'lb' in points.lower() and not any(b in text_after.lower() for b in app.KNOWN_BUILDERS):
+                    angler, boat, btype = name, None, None
+                else:
+                    boat, btype = app.split_boat_and_type(name, text_after)
+                uid = app.normalize_boat_name(boat or angler or f'rank_{rank}')
+                leaderboard.append({
+                    'rank_raw': rank, 'category': category_label or 'Overall',
+                    'angler': angler, 'boat': boat, 'type': btype,
+                    'points': points, 'points_num': app.parse_points_number(points),
+                    'uid': uid, 'image_path': f'/boat-image/{uid}',
+                })
+
+        if categories:
+            for category in categories:
+                tab_link = soup.find('a', string=lambda x: x and x.strip() == category)
+                tab_id = tab_link.get('href') if tab_link else None
+                tab = soup.select_one(tab_id) if tab_id else None
+                if tab:
+                    collect_rows_from_container(tab, category)
+        else:
+            table = soup.find('table')
+            if table:
+                collect_rows_from_container(table, 'Overall')
+
+    return leaderboard
+
+
+_LB_BOATS = ("Reel Time", "Sea Hunter", "Blue Water", "Wave Runner", "Sport Fisher",
+             "Knot Tied", "Salt Life", "Marlin Magic", "Bill Collector", "Rip Tide")
+
+
+def _synthetic_leaderboard(categories: int, rows: int) -> str:
+    """A leaderboard page with `categories` h3 sections of `rows` entries each.
+
+    Every section's entries sit in one wrapper (so each sibling holds many
+    scores and the parser has to descend into it), each entry nested a few
+    levels deep with an image, as ReelTime renders them.
+    """
+    parts = ["<html><body><main>"]
+    for c in range(categories):
+        weight = c % 3 == 2
+        parts.append(f"<h3>Category {c + 1}</h3><div class='list'><div class='inner'>")
+        for r in range(rows):
+            boat = f"{_LB_BOATS[r % len(_LB_BOATS)]} {r + 1}"
+            score = f"{400 + r}.{c % 10} lbs" if weight else f"{(rows - r) * 125:,} pts"
+            parts.append(
+                f"<div class='entry'><div class='left'><span>{r + 1}</span>"
+                f"<img alt='{boat}' src='/img/{r}.jpg'/></div>"
+                f"<div class='right'><p>{boat}</p><p><b>{score}</b></p></div></div>")
+        parts.append("</div></div>")
+    parts.append("</main></body></html>")
+    return "".join(parts)
+
+
+def cmd_leaderboard(args):
+    os.chdir(tempfile.mkdtemp(prefix="bigrock-leaderboard-"))
+    app = _import_app("replay", os.path.abspath(args.fixtures))
+    url = "https://example.invalid/leaderboards"
+    print(f"backend {app.HTML_PARSER}; {args.categories} categories, rows per category: {args.rows}")
+    same = True
+    for rows in args.rows:
+        html = _synthetic_leaderboard(args.categories, rows)
+        results = {}
+        for name, fn in (("legacy", lambda: _legacy_parse_leaderboard_html(app, html, url)),
+                         ("linear", lambda: app._parse_leaderboard_html(html, url))):
+            samples = []
+            for _ in range(args.runs):
+                t0 = time.perf_counter()
+                out = fn()
+                samples.append(time.perf_counter() - t0)
+            results[name] = (out, samples)
+            per_row = statistics.median(samples) / max(1, len(out)) * 1e6
+            print(f"  {rows:4d} rows  {name:7s} {len(out):6d} entries  {per_row:8.1f} µs/entry   {_summary(samples)}")
+        identical = results["legacy"][0] == results["linear"][0]
+        same = same and identical
+        speedup = statistics.median(results["legacy"][1]) / statistics.median(results["linear"][1])
+        print(f"  {rows:4d} rows  speedup {speedup:.2f}x — " + ("✅ identical output" if identical else "❌ output differs"))
+    sys.exit(0 if same else 1)
+
+
+_CHROME_ICON = ("<svg viewBox='0 0 24 24' class='icon'><title>icon</title><path d='M12 2 L2 22 L22 22 Z'/>"
+                "<g><circle cx='12' cy='12' r='4'/><rect x='1' y='1' width='3' height='3'/></g></svg>")
+
+
+def _dress_page(html: str, chrome_kib: int) -> str:
+    """Wrap a recorded page in ~chrome_kib KiB of production-style chrome.
+
+    The recorded fixtures are bare; live pages carry a head full of scripts
+    and styles, an icon-heavy nav and footer around the same <main>.
+    """
+    script = "<script>window.__analytics={q:\"" + "x" * 2000 + "\"}</script>"
+    style = "<style>" + ".c{color:#123456}" * 100 + "</style>"
+    nav_item = f"<li><a href='/x'>{_CHROME_ICON}<span>Menu</span></a></li>"
+    block = script + style + "<nav><ul>" + nav_item * 10 + "</ul></nav><!-- chrome -->"
+    chrome = block * max(1, chrome_kib * 1024 // len(block))
+    head, sep, rest = html.partition("<body")
+    if not sep:
+        return chrome + html
+    body_start = rest.index(">") + 1
+    return head + sep + rest[:body_start] + chrome + rest[body_start:] + "<footer>" + chrome + "</footer>"
+
+
+def _spill_rows(html: str) -> str:
+    """html with the back half of <main>'s rows moved into a section after it."""
+    start, end = html.find("<main>"), html.find("</main>")
+    if start < 0 or end < 0:
+        return html
+    lines = html[start + len("<main>"):end].split("\n")
+    if len(lines) < 2:
+        return html
+    half = len(lines) // 2
+    return (html[:start] + "<main>" + "\n".join(lines[:half]) + "</main><section>"
+            + "\n".join(lines[half:]) + "</section>" + html[end + len("</main>"):])
+
+
+def cmd_scoped(args):
+    import tracemalloc
+    fixtures = os.path.abspath(args.fixtures)
+    os.chdir(tempfile.mkdtemp(prefix="bigrock-scoped-"))
+    app = _import_app("replay", fixtures)
+    pages = _load_pages(fixtures)
+    parsers = _page_parsers(app, pages)
+    print(f"backend {app.HTML_PARSER}; each page wrapped in ~{args.chrome_kib} KiB of chrome")
+    stats = {}      # (page type, scoped) -> [(seconds, peak bytes, html bytes parsed)]
+    mismatches = 0
+    for entry in pages:
+        kind = app.render_profile_for(entry["url"])[0]
+        parse = parsers.get(kind)
+        if not parse:
+            continue
+        html = _dress_page(entry["body"], args.chrome_kib)
+        outputs = {}
+        for scoped in (False, True):
+            app.SCOPED_PARSE = scoped
+            samples = []
+            for _ in range(args.runs):
+                t0 = time.perf_counter()
+                outputs[scoped] = parse(html, entry["url"], None)
+                samples.append(time.perf_counter() - t0)
+            tracemalloc.start()
+            parse(html, entry["url"], None)
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+            parsed = len(app.scope_html(html, kind)) if scoped else len(html)
+            stats.setdefault((kind, scoped), []).append((statistics.median(samples), peak, parsed))
+        if json.dumps(outputs[False], sort_keys=True, default=str) != json.dumps(outputs[True], sort_keys=True, default=str):
+            mismatches += 1
+            print(f"❌ scoped output differs from whole-page output for {entry['url']}")
+        # Same page with half its rows outside <main>: scoping must notice and parse it all
+        spilled = _spill_rows(html)
+        if spilled != html:
+            for scoped in (False, True):
+                app.SCOPED_PARSE = scoped
+                outputs[scoped] = parse(spilled, entry["url"], None)
+            if json.dumps(outputs[False], sort_keys=True, default=str) != json.dumps(outputs[True], sort_keys=True, default=str):
+                mismatches += 1
+                print(f"❌ scoped output drops rows outside <main> for {entry['url']}")
+    app.SCOPED_PARSE = True
+
+    print(f"\n📊 Whole page vs scoped parse (median of {args.runs}), {len(pages)} recorded page(s)")
+    for kind in parsers:
+        if (kind, False) not in stats:
+            continue
+        cells = []
+        for scoped, label in ((False, "whole"), (True, "scoped")):
+            rows = stats[(kind, scoped)]
+            cells.append(f"{label} {statistics.mean(r[0] for r in rows) * 1000:7.2f} ms "
+                         f"peak {statistics.mean(r[1] for r in rows) / 1024:7.0f} KiB "
+                         f"html {statistics.mean(r[2] for r in rows) / 1024:5.0f} KiB")
+        speedup = statistics.mean(r[0] for r in stats[(kind, False)]) / statistics.mean(r[0] for r in stats[(kind, True)])
+        print(f"  {kind:13s} {len(stats[(kind, False)]):3d} page(s)   " + "   ".join(cells) + f"   {speedup:.2f}x")
+    print("✅ Scoped parsing produced identical output" if not mismatches
+          else f"❌ {mismatches} page(s) differ when scoped")
+    sys.exit(1 if mismatches else 0)
+
+
+def _legacy_normalize_boat_name(name):
+    """normalize_boat_name as it was before memoization (reference for `bench.py names`)."""
+    if not name:
+        return "unknown"
+    import unicodedata, re
+    ascii_name = (
+        unicodedata.normalize("NFKD", name)
+        .encode("ascii", "ignore")
+        .decode("ascii")
+        .lower()
+    )
+    return re.sub(r"[^a-z0-9]+", "_", ascii_name).strip("_")
+
+
+def _legacy_is_valid_boat_name(app, name: str) -> bool:
+    """_is_valid_boat_name as it was before memoization (reference for `bench.py names`)."""
+    if not name or len(name) < 2 or len(name) > 70:
+        return False
+    nl = name.lower().strip()
+    if any(nl == s or nl.startswith(s) for s in app._SCRAPER_SKIP_NAMES):
+        return False
+    if app._INVALID_BOAT_CONTENT_RE.search(name):
+        return False
+    if len(name.split()) > 6:
+        return False
+    return bool(re.match(r'^[A-Za-z0-9]', name))
+
+
+def _name_corpus(app, pages: list, repeat: int) -> list:
+    """Every text line the scrapers feed to the name helpers, as pages repeat across polls."""
+    lines = []
+    for entry in pages:
+        soup = app.make_soup(entry["body"])
+        lines.extend(l.strip() for l in soup.get_text("\n").splitlines() if l.strip())
+    # Names the recorded pages are unlikely to carry: accents, emoji, punctuation
+    lines += ["Señorita", "Reel Peñalty 🎣", "Kiss Kiss!", "Ol' Blue", "C-Student",
+              "Pelagic™ Hunter", "Über Reel", "Double D's", "  Sea  Hunter  ", "Hooked Up Again"]
+    return lines * repeat
+
+
+def cmd_names(args):
+    fixtures = os.path.abspath(args.fixtures)
+    os.chdir(tempfile.mkdtemp(prefix="bigrock-names-"))
+    app = _import_app("replay", fixtures)
+    corpus = _name_corpus(app, _load_pages(fixtures), args.repeat)
+    print(f"📄 {len(corpus)} lines ({len(set(corpus))} distinct), {args.runs} run(s)")
+
+    def legacy():
+        return [(_legacy_is_valid_boat_name(app, l), _legacy_normalize_boat_name(l)) for l in corpus]
+
+    def memoized():
+        return [(app._is_valid_boat_name(l), app.normalize_boat_name(l)) for l in corpus]
+
+    def clear():
+        for fn in (app.normalize_boat_name, app._is_valid_boat_name, app.boat_name_info):
+            fn.cache_clear()
+
+    results = {}
+    for name, fn, reset in (("legacy", legacy, None), ("cold cache", memoized, clear), ("warm cache", memoized, None)):
+        samples = []
+        for _ in range(args.runs):
+            if reset:
+                reset()
+            t0 = time.perf_counter()
+            out = fn()
+            samples.append(time.perf_counter() - t0)
+        results[name] = (out, samples)
+        per_line = statistics.median(samples) / len(corpus) * 1e9
+        print(f"  {name:11s} {per_line:8.0f} ns/line   {_summary(samples)}")
+    base = statistics.median(results["legacy"][1])
+    for name in ("cold cache", "warm cache"):
+        print(f"  {name:11s} speedup {base / statistics.median(results[name][1]):.2f}x")
+    # Uncached cost: every distinct line seen once, caches cleared first
+    distinct = sorted(set(corpus))
+    t0 = time.perf_counter()
+    for l in distinct:
+        _legacy_is_valid_boat_name(app, l), _legacy_normalize_boat_name(l)
+    t_legacy = time.perf_counter() - t0
+    clear()
+    t0 = time.perf_counter()
+    for l in distinct:
+        app._is_valid_boat_name(l), app.normalize_boat_name(l)
+    t_new = time.perf_counter() - t0
+    print(f"  first sight {t_new / len(distinct) * 1e9:8.0f} ns/line vs legacy "
+          f"{t_legacy / len(distinct) * 1e9:.0f} ns/line ({len(distinct)} distinct lines, uncached)")
+    info_ok = all(app.boat_name_info(l) == ((l.strip(), app.normalize_boat_name(l.strip()))
+                                           if _legacy_is_valid_boat_name(app, l) else None)
+                  for l in set(corpus))
+    identical = results["legacy"][0] == results["cold cache"][0] == results["warm cache"][0] and info_ok
+    print("✅ identical output" if identical else "❌ output differs")
+    sys.exit(0 if identical else 1)
+
+
+_SPECIES = ("blue marlin", "white marlin", "sailfish", "dolphin", "yellowfin tuna")
+
+
+def _synthetic_events(app, count: int, stored: bool) -> list:
+    """count feed events over four tournament days, newest first like events.json.
+
+    stored=True gives them the ts_epoch/date_et fields the scraper now writes.
+    """
+    from datetime import datetime, timedelta, timezone
+    start = datetime(2026, 6, 6, 11, 0, tzinfo=timezone.utc)
+    kinds = ("Released", "Released", "Boated", "Hooked Up", "Pulled Hook")
+    events = []
+    for i in range(count):
+        boat = f"{_LB_BOATS[i % len(_LB_BOATS)]} {i % 97}"
+        kind = kinds[i % len(kinds)]
+        ts = start + timedelta(days=(i * 7) % 4, seconds=(i * 9973) % 36000)
+        ev = {"timestamp": ts.isoformat(), "event": kind, "boat": boat, "uid": app.normalize_boat_name(boat),
+              "details": f"{boat} {kind.lower()} a {_SPECIES[i % len(_SPECIES)]} (post {i})", "time_str": "5h"}
+        events.append(app._enrich_event(ev) if stored else ev)
+    events.sort(key=lambda e: e["timestamp"], reverse=True)
+    return events
+
+
+def _legacy_release_summary(events: list) -> tuple:
+    """release_summary_data()'s dedup + Eastern day buckets as they were, on dateutil."""
+    from collections import defaultdict
+    from dateutil import parser as date_parser
+    from zoneinfo import ZoneInfo
+    eastern = ZoneInfo("America/New_York")
+    events_sorted = sorted(events, key=lambda e: e.get('timestamp', ''))
+    dedup_seen, deduped = {}, []
+    for e in events_sorted:
+        key = f"{e.get('uid', '')}\x00{e.get('event', '')}\x00{e.get('details', '').strip().lower()}"
+        dt = date_parser.parse(e['timestamp'])
+        prev_times = dedup_seen.get(key, [])
+        if not any(abs((dt - t).total_seconds()) < 12 * 3600 for t in prev_times):
+            dedup_seen.setdefault(key, []).append(dt)
+            deduped.append(e)
+    summary = defaultdict(int)
+    for e in deduped:
+        if e["event"].lower() == "released":
+            summary[date_parser.parse(e["timestamp"]).astimezone(eastern).strftime("%Y-%m-%d")] += 1
+    return [e["timestamp"] for e in deduped], dict(summary)
+
+
+def _new_release_summary(app, events: list) -> tuple:
+    from collections import defaultdict
+    events_sorted = sorted(events, key=app.event_epoch)
+    dedup_seen, deduped = {}, []
+    for e in events_sorted:
+        key = f"{e.get('uid', '')}\x00{e.get('event', '')}\x00{e.get('details', '').strip().lower()}"
+        ts = app.event_epoch(e)
+        prev_times = dedup_seen.get(key, [])
+        if not any(abs(ts - t) < 12 * 3600 for t in prev_times):
+            dedup_seen.setdefault(key, []).append(ts)
+            deduped.append(e)
+    summary = defaultdict(int)
+    for e in deduped:
+        if e["event"].lower() == "released":
+            summary[app.event_date_et(e)] += 1
+    return [e["timestamp"] for e in deduped], dict(summary)
+
+
+def _legacy_time_str(e: dict) -> str:
+    from datetime import datetime
+    from dateutil import parser as date_parser
+    from zoneinfo import ZoneInfo
+    diff = int((datetime.now(ZoneInfo('UTC')) - date_parser.parse(e['timestamp'])).total_seconds())
+    return f"{diff // 86400}d" if diff >= 86400 else f"{diff // 3600}h"
+
+
+def cmd_timestamps(args):
+    from dateutil import parser as date_parser
+    fixtures = os.path.abspath(args.fixtures)
+    work = _replay_workdir(fixtures)
+    os.chdir(work)
+    app = _import_app("replay", fixtures)
+    events = _synthetic_events(app, args.events, stored=True)
+    print(f"📄 {len(events)} synthetic events, {args.runs} run(s)")
+    cases = (
+        ("sort", lambda: [e["timestamp"] for e in sorted(events, key=lambda e: date_parser.parse(e["timestamp"]))],
+                 lambda: [e["timestamp"] for e in sorted(events, key=app.event_epoch)]),
+        ("release summary", lambda: _legacy_release_summary(events), lambda: _new_release_summary(app, events)),
+        ("time_str x100", lambda: [_legacy_time_str(e) for e in events[:100]],
+                          lambda: [app._clean_event(e)["time_str"] for e in events[:100]]),
+    )
+    same = True
+    for label, legacy, new in cases:
+        timed = []
+        for fn in (legacy, new):
+            samples = []
+            for _ in range(args.runs):
+                t0 = time.perf_counter()
+                out = fn()
+                samples.append(time.perf_counter() - t0)
+            timed.append((out, samples))
+        identical = timed[0][0] == timed[1][0]
+        same = same and identical
+        speedup = statistics.median(timed[0][1]) / statistics.median(timed[1][1])
+        print(f"  {label:16s} dateutil {statistics.median(timed[0][1]) * 1000:8.2f} ms   "
+              f"epoch {statistics.median(timed[1][1]) * 1000:8.2f} ms   {speedup:6.1f}x   "
+              + ("✅ identical" if identical else "❌ differs"))
+
+    # End to end: the request handlers on events.json as written before (no
+    # ts_epoch — enriched on import) and as the scraper writes it now. The
+    # routes read the event store, which imports events.json once per
+    # tournament, so it is cleared to re-import each file (the first request
+    # of each case pays for the import).
+    tournament = app.get_current_tournament()
+    client = app.app.test_client()
+    for label, stored in (("events.json without ts_epoch", False), ("events.json with ts_epoch", True)):
+        app.safe_json_dump(app.get_cache_path(tournament, "events.json"), _synthetic_events(app, args.events, stored))
+        app.EVENT_STORE.clear(tournament)
+        for route in ("/hooked", "/release-summary-data"):
+            samples = []
+            for _ in range(args.runs):
+                t0 = time.perf_counter()
+                resp = client.get(route)
+                samples.append(time.perf_counter() - t0)
+            ok = resp.get_json().get("status") == "ok"
+            same = same and ok
+            print(f"  {route:22s} {label:30s} {_summary(samples)}" + ("" if ok else "   ❌ error"))
+    shutil.rmtree(work, ignore_errors=True)
+    sys.exit(0 if same else 1)
+
+
+def _legacy_classify_event(text: str) -> str:
+    """_classify_event as it was before the taxonomy table (reference for `bench.py classify`)."""
+    low = (text or '').lower()
+    if 'released' in low:     return 'Released'
+    if 'boated' in low:       return 'Boated'
+    if 'weighed' in low:      return 'Weighed'
+    if 'pulled hook' in low:  return 'Pulled Hook'
+    if 'wrong species' in low: return 'Wrong Species'
+    if 'hooked up' in low:    return 'Hooked Up'
+    return 'Other'
+
+
+def _legacy_event_consumers(e: dict) -> tuple:
+    """What the request handlers each re-derived from an event's text, per request."""
+    details = e.get("details", "").lower()
+    if "blue marlin" in details:
+        bucket = "blue_marlins"
+    elif "white marlin" in details:
+        bucket = "white_marlins"
+    elif "sailfish" in details:
+        bucket = "sailfish"
+    else:
+        bucket = None
+    resolves = e["event"] in ["Released", "Boated"] or \
+        "pulled hook" in e.get("details", "").lower() or \
+        "wrong species" in e.get("details", "").lower()
+    return bucket, resolves
+
+
+_SPECIES_BUCKETS = {"Blue Marlin": "blue_marlins", "White Marlin": "white_marlins", "Sailfish": "sailfish"}
+
+
+def _new_event_consumers(app, e: dict) -> tuple:
+    return _SPECIES_BUCKETS.get(app.event_species(e)), bool(app.event_resolution(e))
+
+
+def cmd_classify(args):
+    fixtures = os.path.abspath(args.fixtures)
+    os.chdir(tempfile.mkdtemp(prefix="bigrock-classify-"))
+    app = _import_app("replay", fixtures)
+    texts = [e["details"] for e in _synthetic_events(app, args.events, stored=False)]
+    for entry in _load_pages(fixtures):
+        if app.render_profile_for(entry["url"])[0] == "feed":
+            texts += [ev["details"] for _, ev in app._parse_events_page(entry["body"], {})]
+    texts += ["Pulled hook on a blue marlin after 20 minutes", "Wrong species — big mahi released",
+              "Hooked up! Fish on", "Weighed a 512.4 lb blue marlin", "Boated a 68 lbs wahoo", "Team photo"]
+    print(f"📄 {len(texts)} post texts ({len(set(texts))} distinct), {args.runs} run(s)")
+
+    same = all(app._classify_event(t) == _legacy_classify_event(t) for t in texts)
+    app.classify_event_text.cache_clear()
+    t0 = time.perf_counter()
+    for t in texts:
+        app.classify_event_text(t)
+    cold = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    for t in texts:
+        _legacy_classify_event(t)
+    legacy = time.perf_counter() - t0
+    print(f"  classify once    legacy {legacy / len(texts) * 1e6:6.2f} us/post   "
+          f"taxonomy (cold cache) {cold / len(texts) * 1e6:6.2f} us/post — also yields species, weight, resolution")
+
+    # Per request: the handlers used to rescan every event's text; now they read stored fields.
+    events = [{"event": _legacy_classify_event(t), "details": t, "timestamp": "2026-06-07T12:00:00+00:00"}
+              for t in texts]
+    stored = [app._enrich_event(dict(e)) for e in events]
+    timed = {}
+    for name, fn in (("legacy", lambda: [_legacy_event_consumers(e) for e in events]),
+                     ("stored fields", lambda: [_new_event_consumers(app, e) for e in stored])):
+        samples = []
+        for _ in range(args.runs):
+            t0 = time.perf_counter()
+            out = fn()
+            samples.append(time.perf_counter() - t0)
+        timed[name] = (out, samples)
+        print(f"  per request      {name:14s} {_summary(samples)}")
+    same = same and timed["legacy"][0] == timed["stored fields"][0]
+    print(f"  speedup {statistics.median(timed['legacy'][1]) / statistics.median(timed['stored fields'][1]):.1f}x — "
+          + ("✅ identical classification" if same else "❌ classification differs"))
+    sys.exit(0 if same else 1)
+
+
+def _legacy_event_views(app, tournament: str) -> dict:
+    """The live-mode event routes as they were on events.json (reference for `bench.py eventstore`)."""
+    from flask import jsonify
+
+    def load():
+        return app.safe_json_load(app.get_cache_path(tournament, "events.json"), [])
+
+    def scrape_events_view():
+        events = load()
+        events.sort(key=app.event_epoch, reverse=True)
+        cleaned = [app._clean_event(e) for e in events[:100]
+                   if not app._JUNK_DESC_RE.search(e.get('details', '')) and e.get('event', '') != 'Weighed']
+        return jsonify({"status": "ok", "count": len(cleaned), "events": cleaned})
+
+    def weighed_view():
+        weighed = [app._clean_event(e) for e in load()
+                   if e.get('event') == 'Weighed' and not app._JUNK_DESC_RE.search(e.get('details', ''))]
+        weighed.sort(key=lambda e: e.get('timestamp', ''), reverse=True)
+        return jsonify({"status": "ok", "count": len(weighed), "events": weighed[:100]})
+
+    def hooked_view():
+        events = load()
+        events.sort(key=app.event_epoch)
+        active_hooks = {}
+        for e in events:
+            if e.get("event", "").lower() == "hooked up":
+                active_hooks.setdefault(e.get("uid"), []).append(e)
+            elif app.event_resolution(e) and active_hooks.get(e.get("uid")):
+                active_hooks[e.get("uid")].pop(0)
+        hooked_feed = [e for hooks in active_hooks.values() for e in hooks]
+        hooked_feed.sort(key=app.event_epoch, reverse=True)
+        return jsonify({"status": "ok", "count": len(hooked_feed), "events": hooked_feed[:50]})
+
+    def release_summary_view():
+        events = load()
+        _, summary = _new_release_summary(app, events)
+        return jsonify({"status": "ok", "summary": summary, "events": sorted(events, key=app.event_epoch)})
+
+    return {"/scrape/events": scrape_events_view, "/weighed": weighed_view,
+            "/hooked": hooked_view, "/release-summary-data": release_summary_view}
+
+
+def cmd_eventstore(args):
+    fixtures = os.path.abspath(args.fixtures)
+    work = _replay_workdir(fixtures)
+    os.chdir(work)
+    app = _import_app("replay", fixtures)
+    tournament = app.get_current_tournament()
+    views = _legacy_event_views(app, tournament)
+    for route, view in views.items():
+        app.app.add_url_rule("/legacy" + route, "legacy_" + view.__name__, view)
+    client = app.app.test_client()
+    print(f"📄 {tournament}; request latency (median of {args.runs}) as the event count grows")
+    same = True
+    for count in args.events:
+        events = _synthetic_events(app, count, stored=True)
+        app.safe_json_dump(app.get_cache_path(tournament, "events.json"), events)
+        app.EVENT_STORE.clear(tournament)
+        t0 = time.perf_counter()
+        imported = app.EVENT_STORE.count(tournament)      # first access runs the one-time import
+        import_s = time.perf_counter() - t0
+        # keep /scrape/events from rescraping: the feed counts as fresh
+        app.FRESHNESS.stamp(f"events_{tournament}")
+        print(f"  {count:6d} events   import {import_s * 1000:7.1f} ms ({imported} rows)")
+        for route in views:
+            timed = {}
+            for label, url in (("json", "/legacy" + route), ("sqlite", route)):
+                samples = []
+                for _ in range(args.runs):
+                    t0 = time.perf_counter()
+                    resp = client.get(url)
+                    samples.append(time.perf_counter() - t0)
+                timed[label] = (resp.get_json(), statistics.median(samples))
+            old, new = timed["json"][0], timed["sqlite"][0]
+            match = old.get("count") == new.get("count") and \
+                [e.get("timestamp") for e in old.get("events", [])] == [e.get("timestamp") for e in new.get("events", [])]
+            if route == "/release-summary-data":
+                # the store buckets releases itself; totals per day must still agree
+                match = match and old.get("summary") == {s["date"]: s["total_releases"] for s in new.get("summary", [])}
+            same = same and match
+            print(f"    {route:22s} json {timed['json'][1] * 1000:8.2f} ms   sqlite {timed['sqlite'][1] * 1000:8.2f} ms   "
+                  f"{timed['json'][1] / timed['sqlite'][1]:5.1f}x   " + ("✅" if match else "❌ responses differ"))
+    shutil.rmtree(work, ignore_errors=True)
+    sys.exit(0 if same else 1)
+
+
+def cmd_journal(args):
+    fixtures = os.path.abspath(args.fixtures)
+    work = _replay_workdir(fixtures)
+    os.chdir(work)
+    app = _import_app("replay", fixtures)
+    tournament = app.get_current_tournament()
+    app.run_in_thread = lambda target, name: target()     # compact inline so it is timed and counted
+    events = _synthetic_events(app, args.events + args.scrapes * args.new, stored=True)
+    events.sort(key=app.event_epoch)
+    base, batches = events[:args.events], [events[args.events + i * args.new:args.events + (i + 1) * args.new]
+                                          for i in range(args.scrapes)]
+    snapshot, journal = app.EVENT_JOURNAL.paths(tournament)
+    print(f"📄 {args.events} stored events, {args.scrapes} scrapes adding {args.new} each "
+          f"(journal compacts at {app.EVENTS_JOURNAL_MAX_BYTES // 1024} KiB)")
+
+    legacy_file = snapshot + ".legacy"
+    stored, written, t0 = list(base), 0, time.perf_counter()
+    for batch in batches:
+        stored = sorted(stored + batch, key=app.event_epoch, reverse=True)
+        app.safe_json_dump(legacy_file, stored)
+        written += os.path.getsize(legacy_file)
+    legacy_s = time.perf_counter() - t0
+    print(f"  rewrite events.json   {legacy_s * 1000:8.1f} ms   {written / 1024:9.1f} KiB written")
+
+    app.safe_json_dump(snapshot, sorted(base, key=app.event_epoch, reverse=True))
+    before = app.EVENT_JOURNAL.snapshot()
+    t0 = time.perf_counter()
+    for batch in batches:
+        app.EVENT_JOURNAL.append(tournament, batch)
+    journal_s = time.perf_counter() - t0
+    after = app.EVENT_JOURNAL.snapshot()
+    compactions = after["compactions"] - before["compactions"]
+    written = after["appended_bytes"] - before["appended_bytes"] + compactions * after["snapshot_bytes"]
+    print(f"  journal + compaction  {journal_s * 1000:8.1f} ms   {written / 1024:9.1f} KiB written (approx.)"
+          f"   {compactions} compaction(s)")
+    t0 = time.perf_counter()
+    replayed = app.EVENT_JOURNAL.load(tournament)
+    print(f"  read snapshot + tail  {(time.perf_counter() - t0) * 1000:8.1f} ms   "
+          f"{os.path.getsize(journal) / 1024 if os.path.exists(journal) else 0:9.1f} KiB journal tail")
+    same = [app.event_dedup_key(e) for e in replayed] == [app.event_dedup_key(e) for e in stored]
+    print("✅ Replayed events match the rewritten file" if same else "❌ Replayed events differ")
+    shutil.rmtree(work, ignore_errors=True)
+    sys.exit(0 if same else 1)
+
+
+def _legacy_safe_json_load(path, default, copy=True):
+    """safe_json_load before the parsed-JSON cache: every call reads and parses."""
+    try:
+        if os.path.exists(path) and os.path.getsize(path) > 1:
+            with open(path, "r") as f:
+                return json.load(f)
+    except Exception as e:
+        print(f"⚠️ JSON read failed for {path}: {e}")
+    return default
+
+
+def cmd_jsoncache(args):
+    fixtures = os.path.abspath(args.fixtures)
+    work = _replay_workdir(fixtures)
+    os.chdir(work)
+    app = _import_app("replay", fixtures)
+    tournament = app.get_current_tournament()
+    app.scrape_participants(force=True, tournament=tournament)
+    app.scrape_events(force=True, tournament=tournament)
+    app.scrape_leaderboard(tournament, force=True)
+    events = app.EVENT_STORE.latest(tournament, 50)
+    client = app.app.test_client()
+    routes = ["/status", "/participants_data", "/scrape/events", "/weighed", "/hooked",
+              "/api/leaderboard", "/release-summary-data", "/api/boats-today"]
+
+    def emailer_pass():
+        app.get_current_tournament()
+        app.get_data_source()
+        for e in events:
+            app.should_email(e)
+
+    print(f"📄 {tournament}; median of {args.runs} x {args.repeat} calls")
+    cached = app.safe_json_load
+    for label, run in [("emailer pass", emailer_pass)] + [(r, lambda r=r: client.get(r)) for r in routes]:
+        timed, bodies = {}, {}
+        for name, loader in (("legacy", _legacy_safe_json_load), ("cached", cached)):
+            app.safe_json_load = loader
+            samples = []
+            for _ in range(args.runs):
+                t0 = time.perf_counter()
+                for _ in range(args.repeat):
+                    out = run()
+                samples.append((time.perf_counter() - t0) / args.repeat)
+            timed[name] = statistics.median(samples)
+            bodies[name] = out.get_json() if out is not None else None
+        app.safe_json_load = cached
+        print(f"  {label:22s} legacy {timed['legacy'] * 1000:8.3f} ms   cached {timed['cached'] * 1000:8.3f} ms   "
+              f"{timed['legacy'] / timed['cached']:5.1f}x")
+    stats = app.JSON_CACHE.snapshot()
+    print(f"  json cache: {stats['hits']} hits / {stats['misses']} misses ({stats['hit_rate']}), "
+          f"{stats['files']} files, {stats['bytes'] / 1024:.0f} KiB")
+
+    # A write by safe_json_dump or behind the app's back must be seen by the next read
+    settings = app.load_settings()
+    app.safe_json_dump(app.SETTINGS_FILE, {**settings, "bench_marker": 1})
+    seen_dump = app.load_settings().get("bench_marker") == 1
+    with open(app.SETTINGS_FILE, "w") as f:
+        json.dump({**settings, "bench_marker": 22}, f)
+    seen_external = app.load_settings().get("bench_marker") == 22
+    app.load_settings()["bench_marker"] = 3
+    isolated = app.load_settings().get("bench_marker") == 22
+    ok = seen_dump and seen_external and isolated
+    print("✅ Cache follows writes and hands out private copies" if ok else
+          f"❌ stale or shared data (dump {seen_dump}, external {seen_external}, copies {isolated})")
+    shutil.rmtree(work, ignore_errors=True)
+    sys.exit(0 if ok else 1)
+
+
+def _legacy_stamp(app, key: str):
+    """A scraper's freshness stamp before FreshnessStore: load, set one key, save the whole file."""
+    cache = _legacy_safe_json_load(app.CACHE_FILE, {})
+    cache[key] = {"last_scraped": app.datetime.now().isoformat()}
+    tmp = f"{app.CACHE_FILE}.tmp"
+    with open(tmp, "w") as f:
+        json.dump(cache, f, indent=2)
+    os.replace(tmp, app.CACHE_FILE)
+
+
+def cmd_contention(args):
+    import threading
+    fixtures = os.path.abspath(args.fixtures)
+    work = _replay_workdir(fixtures)
+    os.chdir(work)
+    app = _import_app("replay", fixtures)
+    print(f"📄 {args.threads} threads x {args.ops} stamps on distinct keys, then {args.rounds} claim races")
+
+    def hammer(stamp) -> tuple[float, int, int]:
+        if os.path.exists(app.CACHE_FILE):
+            os.remove(app.CACHE_FILE)
+        errors = []
+        start = threading.Barrier(args.threads)
+
+        def worker(n):
+            start.wait()
+            for i in range(args.ops):
+                try:
+                    stamp(f"t{n}_k{i}")
+                except Exception as e:      # concurrent writers racing on the shared .tmp file
+                    errors.append(e)
+        threads = [threading.Thread(target=worker, args=(n,)) for n in range(args.threads)]
+        t0 = time.perf_counter()
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        elapsed = time.perf_counter() - t0
+        kept = len(_legacy_safe_json_load(app.CACHE_FILE, {}))
+        return elapsed, kept, len(errors)
+
+    expected = args.threads * args.ops
+    ok = True
+    for label, stamp in (("load/mutate/save", lambda key: _legacy_stamp(app, key)),
+                         ("FreshnessStore", app.FRESHNESS.stamp)):
+        elapsed, kept, errors = hammer(stamp)
+        lost = expected - kept
+        print(f"  {label:17s} {elapsed * 1000:8.1f} ms   {kept}/{expected} stamps kept   "
+              f"{lost} lost   {errors} write errors")
+        if label == "FreshnessStore":
+            ok = lost == 0 and errors == 0
+
+    # Every round: the key is stale, all threads race to claim its refresh — exactly one may win
+    winners = []
+    for r in range(args.rounds):
+        key = f"race_{r}"
+        wins = []
+        start = threading.Barrier(args.threads)
+
+        def racer():
+            start.wait()
+            if app.FRESHNESS.claim_refresh(key, 10):
+                wins.append(1)
+        threads = [threading.Thread(target=racer) for _ in range(args.threads)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        winners.append(len(wins))
+    single = all(w == 1 for w in winners)
+    print(f"  claim_refresh     {args.rounds} rounds, winners per round: "
+          f"{min(winners)}-{max(winners)} " + ("✅" if single else "❌"))
+    ok = ok and single
+    print("✅ No lost stamps, one refresh winner per race" if ok else "❌ Lost updates or duplicate refreshes")
+    shutil.rmtree(work, ignore_errors=True)
+    sys.exit(0 if ok else 1)
+
+
+def cmd_serialize(args):
+    fixtures = os.path.abspath(args.fixtures)
+    work = _replay_workdir(fixtures)
+    os.chdir(work)
+    app = _import_app("replay", fixtures)
+    tournament = app.get_current_tournament()
+    events = _synthetic_events(app, args.events, stored=True)
+    events.sort(key=app.event_epoch, reverse=True)
+    demo = [{**e, "hookup_id": f"{e['uid']}_{e['timestamp']}"} for e in events]   # demo rows carry hookup ids
+    leaderboard = app._parse_leaderboard_html(_synthetic_leaderboard(8, 60), "https://example.test/leaderboards.html")
+    caches = {
+        "events.json": events,
+        "demo_data.json": {tournament: {"events": demo, "leaderboard": leaderboard}},
+        "leaderboard.json": leaderboard,
+    }
+    backends = [("json", "stdlib json")]
+    try:
+        import orjson  # noqa: F401
+        backends.append(("orjson", "orjson"))
+    except ImportError:
+        print("ℹ️ orjson not installed — only the stdlib backend is compared (pip install orjson)")
+    print(f"📄 {args.events} synthetic events, median of {args.runs}")
+
+    def timed(fn):
+        samples = []
+        for _ in range(args.runs):
+            t0 = time.perf_counter()
+            fn()
+            samples.append(time.perf_counter() - t0)
+        return statistics.median(samples)
+
+    ok = True
+    for name, obj in caches.items():
+        path = os.path.join(work, name)
+        legacy_dump = timed(lambda: open(path, "w").write(json.dumps(obj, indent=2)))
+        legacy_size = os.path.getsize(path)
+        legacy_load = timed(lambda: json.load(open(path)))
+        print(f"  {name:18s} indent=2 (before)   dump {legacy_dump * 1000:7.1f} ms   load {legacy_load * 1000:7.1f} ms   "
+              f"{legacy_size / 1024:8.1f} KiB")
+        for backend, label in backends:
+            app.set_json_backend(backend)
+            app.JSON_CACHE.discard(path)
+            # Old pretty files must still read back identically through the new path
+            old_format = app.json_loads(open(path, "rb").read()) == obj
+            dump_s = timed(lambda: app.safe_json_dump(path, obj))
+            size = os.path.getsize(path)
+            load_s = timed(lambda: app.json_loads(open(path, "rb").read()))
+            same = old_format and app.json_loads(open(path, "rb").read()) == obj
+            ok = ok and same
+            print(f"  {'':18s} {label + ' compact':19s} dump {dump_s * 1000:7.1f} ms   load {load_s * 1000:7.1f} ms   "
+                  f"{size / 1024:8.1f} KiB   {legacy_size / size:4.1f}x smaller   "
+                  + ("✅" if same else "❌ round trip differs"))
+    print("✅ Old and new formats read back identically" if ok else "❌ Serializer round trip failed")
+    shutil.rmtree(work, ignore_errors=True)
+    sys.exit(0 if ok else 1)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p = sub.add_parser("record", help="scrape the live site once and save fixtures")
+    p.add_argument("--tournament", help="tournament name (default: settings.json)")
+    p.add_argument("--fixtures", default=DEFAULT_FIXTURES)
+    p.set_defaults(func=cmd_record)
+
+    p = sub.add_parser("scrapers", help="time the scrapers against recorded fixtures")
+    p.add_argument("--tournament", help="tournament name (default: the recorded one)")
+    p.add_argument("--fixtures", default=DEFAULT_FIXTURES)
+    p.add_argument("--runs", type=int, default=5)
+    p.add_argument("--latency-ms", type=float, default=0, help="injected delay per replayed request")
+    p.set_defaults(func=cmd_scrapers)
+
+    p = sub.add_parser("parity", help="check HTML backends parse recorded pages identically, and time them")
+    p.add_argument("--fixtures", default=DEFAULT_FIXTURES)
+    p.add_argument("--runs", type=int, default=5)
+    p.set_defaults(func=cmd_parity)
+
+    p = sub.add_parser("tokenizer", help="feed parser micro-benchmark: legacy three-pass scan vs tokenizer")
+    p.add_argument("--fixtures", default=DEFAULT_FIXTURES)
+    p.add_argument("--runs", type=int, default=20)
+    p.add_argument("--scale", type=int, default=10, help="repeat the page body N times")
+    p.set_defaults(func=cmd_tokenizer)
+
+    p = sub.add_parser("leaderboard", help="leaderboard parser scaling: legacy nested find_all vs linear walk")
+    p.add_argument("--fixtures", default=DEFAULT_FIXTURES)
+    p.add_argument("--runs", type=int, default=5)
+    p.add_argument("--categories", type=int, default=12)
+    p.add_argument("--rows", type=int, nargs="+", default=[50, 100, 200, 400])
+    p.set_defaults(func=cmd_leaderboard)
+
+    p = sub.add_parser("scoped", help="whole-page vs scoped (pre-sliced) parsing: output, time and peak memory")
+    p.add_argument("--fixtures", default=DEFAULT_FIXTURES)
+    p.add_argument("--runs", type=int, default=5)
+    p.add_argument("--chrome-kib", type=int, default=200, help="site chrome wrapped around each recorded page")
+    p.set_defaults(func=cmd_scoped)
+
+    p = sub.add_parser("names", help="boat-name validation/normalization: legacy vs memoized, on recorded page text")
+    p.add_argument("--fixtures", default=DEFAULT_FIXTURES)
+    p.add_argument("--runs", type=int, default=5)
+    p.add_argument("--repeat", type=int, default=20, help="repeat the corpus N times, as successive polls do")
+    p.set_defaults(func=cmd_names)
+
+    p = sub.add_parser("timestamps", help="event sorting/dedup/day buckets: dateutil vs stored ts_epoch, plus handler latency")
+    p.add_argument("--fixtures", default=DEFAULT_FIXTURES)
+    p.add_argument("--runs", type=int, default=5)
+    p.add_argument("--events", type=int, default=2000)
+    p.set_defaults(func=cmd_timestamps)
+
+    p = sub.add_parser("classify", help="event taxonomy: legacy per-request text scans vs fields stored at ingest")
+    p.add_argument("--fixtures", default=DEFAULT_FIXTURES)
+    p.add_argument("--runs", type=int, default=5)
+    p.add_argument("--events", type=int, default=2000)
+    p.set_defaults(func=cmd_classify)
+
+    p = sub.add_parser("eventstore", help="event route latency: whole events.json vs SQLite queries, growing event counts")
+    p.add_argument("--fixtures", default=DEFAULT_FIXTURES)
+    p.add_argument("--runs", type=int, default=5)
+    p.add_argument("--events", type=int, nargs="+", default=[500, 2000, 8000, 20000])
+    p.set_defaults(func=cmd_eventstore)
+
+    p = sub.add_parser("journal", help="events.json write volume: full rewrite per scrape vs journal + compaction")
+    p.add_argument("--fixtures", default=DEFAULT_FIXTURES)
+    p.add_argument("--events", type=int, default=5000, help="events already stored")
+    p.add_argument("--scrapes", type=int, default=200)
+    p.add_argument("--new", type=int, default=2, help="new events per scrape")
+    p.set_defaults(func=cmd_journal)
+
+    p = sub.add_parser("jsoncache", help="hot JSON reads (settings, cache, participants): re-parse vs parsed cache")
+    p.add_argument("--fixtures", default=DEFAULT_FIXTURES)
+    p.add_argument("--runs", type=int, default=5)
+    p.add_argument("--repeat", type=int, default=20)
+    p.set_defaults(func=cmd_jsoncache)
+
+    p = sub.add_parser("contention", help="cache.json stamps from many threads: lost updates and claim races")
+    p.add_argument("--fixtures", default=DEFAULT_FIXTURES)
+    p.add_argument("--threads", type=int, default=16)
+    p.add_argument("--ops", type=int, default=50, help="stamps per thread")
+    p.add_argument("--rounds", type=int, default=50, help="claim_refresh races")
+    p.set_defaults(func=cmd_contention)
+
+    p = sub.add_parser("serialize", help="cache file dump/load time and size: indent=2 stdlib vs compact backends")
+    p.add_argument("--fixtures", default=DEFAULT_FIXTURES)
+    p.add_argument("--runs", type=int, default=5)
+    p.add_argument("--events", type=int, default=20000)
+    p.set_defaults(func=cmd_serialize)
+
+    args = parser.parse_args()
+    args.func(args)
+
+
+if __name__ == "__main__":
+    main()